@@ -0,0 +1,16 @@
+"""
+Gunicorn settings for running the API with several Uvicorn workers:
+
+    gunicorn -c gunicorn_conf.py server:app
+
+UvicornWorker runs on uvloop and the httptools parser when they are installed.
+Single-process equivalent:
+
+    uvicorn server:app --loop uvloop --http httptools
+"""
+import multiprocessing
+import os
+
+bind = os.getenv("BIND", "0.0.0.0:8001")
+workers = int(os.getenv("WEB_CONCURRENCY", multiprocessing.cpu_count()))
+worker_class = "uvicorn.workers.UvicornWorker"
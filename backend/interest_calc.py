@@ -0,0 +1,19 @@
+"""
+Vectorized interest calculation for batches of loans
+"""
+import numpy as np
+
+# Annual interest rate (assumed 24% per annum)
+ANNUAL_RATE = 0.24
+DAYS_PER_YEAR = 365
+
+
+def interest_batch(principals, days, annual_rate: float = ANNUAL_RATE) -> np.ndarray:
+    """Interest for many loans at once: simple for the first year, compound after that"""
+    principals = np.asarray(principals, dtype=np.float64)
+    days = np.asarray(days, dtype=np.int64)
+
+    years = days / DAYS_PER_YEAR
+    simple = principals * annual_rate * years
+    compound = principals * np.power(1.0 + annual_rate, years) - principals
+    return np.where(days <= DAYS_PER_YEAR, simple, compound)
@@ -1,6 +1,5 @@
 class Loan(BaseModel):
-    model_config = ConfigDict(extra="ignore")
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=_new_id)
     serial_no: str
     customer_id: str
     customer_name: str
@@ -10,7 +9,7 @@ class Loan(BaseModel):
     last_interest_payment_date: Optional[datetime] = None  # Track when interest was last paid
     status: str = "active"  # active, closed, overdue
     items: List[Item] = []
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = Field(default_factory=_now_utc)
     
 class LoanCreate(BaseModel):
     customer_id: str
@@ -21,8 +20,7 @@ class LoanCreate(BaseModel):
     items: List[ItemCreate]
 
 class Payment(BaseModel):
-    model_config = ConfigDict(extra="ignore")
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=_new_id)
     loan_id: str
     loan_serial_no: str
     customer_name: str
@@ -33,7 +31,7 @@ class Payment(BaseModel):
     principal_paid: float = 0.0  # Amount paid towards principal
     interest_paid: float = 0.0   # Amount paid towards interest
     notes: Optional[str] = None
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = Field(default_factory=_now_utc)
 
 class PaymentCreate(BaseModel):
     loan_id: str
@@ -1,24 +1,40 @@
 # =========================
 # Imports
 # =========================
-from fastapi import FastAPI, APIRouter, HTTPException, Depends, status
+from fastapi import FastAPI, APIRouter, HTTPException, Depends, Query, Body, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from fastapi.responses import ORJSONResponse
+from fastapi.concurrency import run_in_threadpool
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import ReturnDocument
+from pymongo.errors import BulkWriteError, DuplicateKeyError, OperationFailure
 
 import os
+import asyncio
 import logging
 from pathlib import Path
 from pydantic import BaseModel, Field, ConfigDict
-from typing import List, Optional
+from typing import List, Optional, TypedDict, NotRequired
 import uuid
+import hashlib
 from datetime import datetime, timezone
+from functools import partial
 from passlib.context import CryptContext
+from cachetools import TTLCache
 import jwt
+import msgspec
+import numpy as np
 from decimal import Decimal, ROUND_HALF_UP
 import math
 
+try:
+    from interest_calc import interest_batch, ANNUAL_RATE, DAYS_PER_YEAR
+except ModuleNotFoundError:
+    # Imported as backend.server from the repository root
+    from backend.interest_calc import interest_batch, ANNUAL_RATE, DAYS_PER_YEAR
+
 # =========================
 # App Initialization
 # =========================
@@ -39,31 +55,52 @@ DB_NAME = os.getenv("DB_NAME")
 if not MONGO_URL or not DB_NAME:
     raise RuntimeError("MONGO_URL or DB_NAME not set in environment variables")
 
-client = AsyncIOMotorClient(MONGO_URL)
+# tz_aware: datetimes are stored as native BSON dates and read back as UTC-aware
+client = AsyncIOMotorClient(MONGO_URL, tz_aware=True)
 db = client[DB_NAME]
 
 # =========================
 # Security
 # =========================
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Argon2id (argon2-cffi backend) for new hashes; legacy bcrypt hashes still verify
+# and are upgraded on login. Parameters follow the OWASP argon2id baseline.
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    deprecated="auto",
+    argon2__type="ID",
+    argon2__time_cost=2,
+    argon2__memory_cost=19456,
+    argon2__parallelism=1,
+)
 security = HTTPBearer()
 JWT_SECRET = os.getenv("JWT_SECRET", "dev-secret-change-me")
 JWT_ALGORITHM = "HS256"
+# Resolved once at import instead of on every token encode/decode
+_jwt = jwt.PyJWT()
+_JWT_KEY = JWT_SECRET.encode()
+_JWT_ALGORITHMS = [JWT_ALGORITHM]
 
 # Create the main app without a prefix
-app = FastAPI(title="Gold Silver Loan Management System")
+app = FastAPI(title="Gold Silver Loan Management System", default_response_class=ORJSONResponse)
 
 # Create a router with the /api prefix
 api_router = APIRouter(prefix="/api")
 
+# Default factories shared by every model
+_now_utc = partial(datetime.now, timezone.utc)
+
+def _new_id() -> str:
+    return uuid.uuid4().hex
+
 # Models
 class User(BaseModel):
-    model_config = ConfigDict(extra="ignore")
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    # Frozen: instances are shared between requests through the auth cache
+    model_config = ConfigDict(frozen=True)
+    id: str = Field(default_factory=_new_id)
     email: str
     name: str
     is_active: bool = True
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = Field(default_factory=_now_utc)
 
 class UserCreate(BaseModel):
     email: str
@@ -80,23 +117,21 @@ class Token(BaseModel):
     user: User
 
 class Customer(BaseModel):
-    model_config = ConfigDict(extra="ignore")
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=_new_id)
     name: str
     phone: str
     address: str
     id_proof: str
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = Field(default_factory=_now_utc)
 
-class CustomerCreate(BaseModel):
+class CustomerCreate(TypedDict):
     name: str
     phone: str
     address: str
     id_proof: str
 
 class Item(BaseModel):
-    model_config = ConfigDict(extra="ignore")
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=_new_id)
     qty: int
     item_name: str
     metal: str  # Gold/Silver
@@ -105,7 +140,7 @@ class Item(BaseModel):
     fine_weight: float
     value: float
 
-class ItemCreate(BaseModel):
+class ItemCreate(TypedDict):
     qty: int
     item_name: str
     metal: str
@@ -115,8 +150,7 @@ class ItemCreate(BaseModel):
     value: float
 
 class Loan(BaseModel):
-    model_config = ConfigDict(extra="ignore")
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=_new_id)
     serial_no: str
     customer_id: str
     customer_name: str
@@ -125,19 +159,18 @@ class Loan(BaseModel):
     loan_date: datetime
     status: str = "active"  # active, closed, overdue
     items: List[Item] = []
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = Field(default_factory=_now_utc)
     
-class LoanCreate(BaseModel):
+class LoanCreate(TypedDict):
     customer_id: str
     customer_name: str
     principal_amount: float
-    monthly_interest: float = 2.0
+    monthly_interest: NotRequired[float]
     loan_date: datetime
     items: List[ItemCreate]
 
 class Payment(BaseModel):
-    model_config = ConfigDict(extra="ignore")
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=_new_id)
     loan_id: str
     loan_serial_no: str
     customer_name: str
@@ -145,13 +178,13 @@ class Payment(BaseModel):
     payment_date: datetime
     payment_type: str = "cash"
     notes: Optional[str] = None
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = Field(default_factory=_now_utc)
 
-class PaymentCreate(BaseModel):
+class PaymentCreate(TypedDict):
     loan_id: str
     amount: float
     payment_date: datetime
-    notes: Optional[str] = None
+    notes: NotRequired[Optional[str]]
 
 class DashboardStats(BaseModel):
     total_active_loans: int
@@ -161,26 +194,87 @@ class DashboardStats(BaseModel):
     recent_loans: List[Loan]
     recent_payments: List[Payment]
 
+# Storage records for the loan/payment write paths: msgspec validates and builds
+# these in C, while the Pydantic models above stay at the API boundary. They are
+# slotted and never form reference cycles, so they opt out of GC tracking.
+class ItemRecord(msgspec.Struct, kw_only=True, gc=False):
+    id: str = msgspec.field(default_factory=_new_id)
+    qty: int
+    item_name: str
+    metal: str
+    weight: float
+    percentage: float
+    fine_weight: float
+    value: float
+
+class LoanRecord(msgspec.Struct, kw_only=True, gc=False):
+    id: str = msgspec.field(default_factory=_new_id)
+    serial_no: str
+    customer_id: str
+    customer_name: str
+    principal_amount: float
+    monthly_interest: float = 2.0
+    loan_date: datetime
+    status: str = "active"
+    items: List[ItemRecord] = []
+    created_at: datetime = msgspec.field(default_factory=_now_utc)
+
+class PaymentRecord(msgspec.Struct, kw_only=True, gc=False):
+    id: str = msgspec.field(default_factory=_new_id)
+    loan_id: str
+    loan_serial_no: str
+    customer_name: str
+    amount: float
+    payment_date: datetime
+    payment_type: str = "cash"
+    notes: Optional[str] = None
+    created_at: datetime = msgspec.field(default_factory=_now_utc)
+
 # Utility Functions
+def parse_body(payload, schema):
+    """Validate a raw request body against a TypedDict schema (unknown keys are dropped)"""
+    try:
+        return msgspec.convert(payload, schema, strict=False)
+    except msgspec.ValidationError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
+
+def to_document(record: msgspec.Struct) -> dict:
+    """Convert a storage record to a Mongo document, keeping datetimes as BSON dates"""
+    return msgspec.to_builtins(record, builtin_types=(datetime,))
+
+def as_datetime(value) -> datetime:
+    """Documents written before dates were stored natively hold ISO strings"""
+    return datetime.fromisoformat(value) if isinstance(value, str) else value
+
 def hash_password(password: str) -> str:
     return pwd_context.hash(password)
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+# (hashed_password, sha256(plain_password)) -> bool, so repeat logins skip the hash cost
+_password_cache = TTLCache(maxsize=2048, ttl=60)
+
+async def verify_password(plain_password: str, hashed_password: str) -> tuple[bool, Optional[str]]:
+    """Verify off the event loop; also returns a new hash when the stored one uses an outdated scheme"""
+    key = (hashed_password, hashlib.sha256(plain_password.encode()).hexdigest())
+    result = _password_cache.get(key)
+    if result is not None:
+        return result, None
+    result, new_hash = await run_in_threadpool(pwd_context.verify_and_update, plain_password, hashed_password)
+    _password_cache[key] = result
+    return result, new_hash
 
 def create_access_token(data: dict) -> str:
-    return jwt.encode(data, JWT_SECRET, algorithm=JWT_ALGORITHM)
+    return _jwt.encode(data, _JWT_KEY, algorithm=JWT_ALGORITHM)
 
 def decode_access_token(token: str) -> dict:
     try:
-        payload = jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALGORITHM])
+        payload = _jwt.decode(token, _JWT_KEY, algorithms=_JWT_ALGORITHMS)
         return payload
     except jwt.PyJWTError:
         return None
 
-async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)):
-    token = credentials.credentials
-    payload = decode_access_token(token)
+async def get_current_email(credentials: HTTPAuthorizationCredentials = Depends(security)) -> str:
+    """JWT-only auth for handlers that never read the user record (no database lookup)"""
+    payload = decode_access_token(credentials.credentials)
     if payload is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -192,27 +286,107 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(s
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials",
         )
+    return user_email
+
+# raw JWT -> User, so repeat requests with the same token skip the users lookup
+_user_cache = TTLCache(maxsize=1024, ttl=300)
+
+async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)):
+    token = credentials.credentials
+    cached_user = _user_cache.get(token)
+    if cached_user is not None:
+        return cached_user
+    user_email = await get_current_email(credentials)
     user = await db.users.find_one({"email": user_email}, {"_id": 0})
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="User not found",
         )
-    return User(**user)
+    user = User(**user)
+    _user_cache[token] = user
+    return user
+
+# Pages need a total order; _id breaks ties between documents created together
+NEWEST_FIRST = [("created_at", -1), ("_id", -1)]
+
+async def create_indexes():
+    """Ensure the indexes used by the read paths exist (no-op when already present)"""
+    await asyncio.gather(
+        db.users.create_index("email", unique=True),
+        db.customers.create_index("phone"),
+        db.loans.create_index("id", unique=True),
+        create_serial_index(),
+        db.loans.create_index("status"),
+        db.loans.create_index(NEWEST_FIRST),
+        db.payments.create_index(NEWEST_FIRST),
+    )
+
+async def create_serial_index():
+    """Make loan serials unique; databases that cannot take the unique index keep a plain one"""
+    try:
+        await db.loans.create_index("serial_no", unique=True)
+    except OperationFailure as e:
+        if isinstance(e, DuplicateKeyError):
+            duplicates = await db.loans.aggregate([
+                {"$group": {"_id": "$serial_no", "count": {"$sum": 1}}},
+                {"$match": {"count": {"$gt": 1}}},
+                {"$sort": {"_id": 1}},
+            ]).to_list(None)
+            logger.error(
+                "Duplicate loan serial numbers, serial_no stays non-unique until they are fixed: %s",
+                ", ".join(f"{dup['_id']} (x{dup['count']})" for dup in duplicates),
+            )
+        else:
+            # e.g. an older non-unique serial_no index is already present
+            logger.error("Could not create unique serial_no index: %s", e)
+        await db.loans.create_index("serial_no")
+
+LOAN_SERIAL_START = 150
+
+async def init_loan_serial_counter():
+    """Seed the loan serial counter from the highest existing serial (first run only)"""
+    if await db.counters.find_one({"_id": "loan_serial"}):
+        return
+    last_num = LOAN_SERIAL_START - 1
+    # Extract number from A150, A151, etc.; serials that do not parse are ignored
+    result = await db.loans.aggregate([
+        {"$group": {"_id": None, "max_num": {"$max": {"$convert": {
+            "input": {"$substrCP": ["$serial_no", 1, {"$strLenCP": {"$ifNull": ["$serial_no", ""]}}]},
+            "to": "int",
+            "onError": None,
+            "onNull": None,
+        }}}}},
+    ]).to_list(1)
+    if result and result[0]["max_num"] is not None:
+        last_num = max(last_num, result[0]["max_num"])
+    await db.counters.update_one(
+        {"_id": "loan_serial"},
+        {"$setOnInsert": {"seq": last_num}},
+        upsert=True
+    )
+
+async def reserve_serial_numbers(count: int) -> List[str]:
+    """Reserve `count` consecutive serial numbers with a single atomic counter update"""
+    increment = partial(
+        db.counters.find_one_and_update,
+        {"_id": "loan_serial"},
+        {"$inc": {"seq": count}},
+        return_document=ReturnDocument.AFTER
+    )
+    counter = await increment()
+    if counter is None:
+        # Counter missing (e.g. dropped): reseed it from the existing loans rather
+        # than letting an upsert restart the serials at A1
+        await init_loan_serial_counter()
+        counter = await increment()
+    last_num = counter["seq"]
+    return [f"A{num}" for num in range(last_num - count + 1, last_num + 1)]
 
 async def generate_serial_number() -> str:
     """Generate next serial number starting from A150"""
-    last_loan = await db.loans.find_one({}, {"_id": 0, "serial_no": 1}, sort=[("created_at", -1)])
-    if last_loan and last_loan.get("serial_no"):
-        # Extract number from A150, A151, etc.
-        try:
-            last_num = int(last_loan["serial_no"][1:])
-            next_num = last_num + 1
-        except:
-            next_num = 150
-    else:
-        next_num = 150
-    return f"A{next_num}"
+    serial_numbers = await reserve_serial_numbers(1)
+    return serial_numbers[0]
 
 def calculate_interest(principal: float, start_date: datetime, current_date: datetime = None) -> dict:
     """Calculate interest: Simple for first year, compound after that"""
@@ -221,19 +395,15 @@ def calculate_interest(principal: float, start_date: datetime, current_date: dat
     
     # Calculate days
     total_days = (current_date - start_date).days
+    years = total_days / DAYS_PER_YEAR
     
-    # Annual interest rate (assumed 24% per annum)
-    annual_rate = 0.24
-    
-    if total_days <= 365:
+    if total_days <= DAYS_PER_YEAR:
         # Simple interest for first year
-        interest = principal * annual_rate * (total_days / 365)
+        interest = principal * ANNUAL_RATE * years
         interest_type = "simple"
     else:
         # Compound interest after first year
-        years = total_days / 365
-        total_amount = principal * ((1 + annual_rate) ** years)
-        interest = total_amount - principal
+        interest = principal * ((1 + ANNUAL_RATE) ** years) - principal
         interest_type = "compound"
     
     return {
@@ -250,15 +420,15 @@ async def root():
 @api_router.post("/auth/register", response_model=User)
 async def register_user(user_data: UserCreate):
     # Check if user exists
-    existing_user = await db.users.find_one({"email": user_data.email})
+    existing_user = await db.users.find_one({"email": user_data.email}, {"_id": 1})
     if existing_user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email already registered"
         )
     
-    # Hash password
-    hashed_password = hash_password(user_data.password)
+    # Hash off the event loop
+    hashed_password = await run_in_threadpool(hash_password, user_data.password)
     
     # Create user
     user_dict = user_data.model_dump()
@@ -267,7 +437,6 @@ async def register_user(user_data: UserCreate):
     
     # Store in database
     doc = user_obj.model_dump()
-    doc["created_at"] = doc["created_at"].isoformat()
     doc["password"] = hashed_password
     
     await db.users.insert_one(doc)
@@ -277,53 +446,71 @@ async def register_user(user_data: UserCreate):
 async def login_user(user_data: UserLogin):
     # Find user
     user_doc = await db.users.find_one({"email": user_data.email})
-    if not user_doc or not verify_password(user_data.password, user_doc["password"]):
+    verified, new_hash = False, None
+    if user_doc:
+        verified, new_hash = await verify_password(user_data.password, user_doc["password"])
+    if not verified:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password"
         )
     
+    # Store the re-hash of legacy (bcrypt) passwords made during verification
+    if new_hash:
+        await db.users.update_one(
+            {"email": user_data.email},
+            {"$set": {"password": new_hash}}
+        )
+    
     # Create access token
     access_token = create_access_token(data={"sub": user_data.email})
     
-    # Convert datetime string back to datetime object if needed
-    if isinstance(user_doc["created_at"], str):
-        user_doc["created_at"] = datetime.fromisoformat(user_doc["created_at"])
-    
     user = User(**{k: v for k, v in user_doc.items() if k != "password" and k != "_id"})
     
     return Token(access_token=access_token, token_type="bearer", user=user)
 
 # Customer Routes
 @api_router.post("/customers", response_model=Customer)
-async def create_customer(customer_data: CustomerCreate, current_user: User = Depends(get_current_user)):
+async def create_customer(payload: dict = Body(...), current_user: User = Depends(get_current_user)):
+    customer_data = parse_body(payload, CustomerCreate)
+    
     # Validate input data
-    if not customer_data.name.strip():
+    if not customer_data["name"].strip():
         raise HTTPException(status_code=400, detail="Customer name is required")
-    if not customer_data.phone.strip():
+    if not customer_data["phone"].strip():
         raise HTTPException(status_code=400, detail="Phone number is required")
-    if not customer_data.address.strip():
+    if not customer_data["address"].strip():
         raise HTTPException(status_code=400, detail="Address is required")
-    if not customer_data.id_proof.strip():
+    if not customer_data["id_proof"].strip():
         raise HTTPException(status_code=400, detail="ID proof is required")
     
-    customer_obj = Customer(**customer_data.model_dump())
+    # Fields are already checked above, so skip Pydantic validation
+    customer_obj = Customer.model_construct(**customer_data)
     
     doc = customer_obj.model_dump()
-    doc["created_at"] = doc["created_at"].isoformat()
     
     await db.customers.insert_one(doc)
     return customer_obj
 
-@api_router.get("/customers", response_model=List[Customer])
-async def get_customers(current_user: User = Depends(get_current_user)):
-    customers = await db.customers.find({}, {"_id": 0}).to_list(1000)
-    
-    for customer in customers:
-        if isinstance(customer["created_at"], str):
-            customer["created_at"] = datetime.fromisoformat(customer["created_at"])
+# List endpoints return the stored documents as-is; `responses` keeps the schema
+# in the OpenAPI docs without re-validating every document on the way out.
+MAX_PAGE_SIZE = 1000
+
+@api_router.get("/customers", responses={200: {"model": List[Customer]}})
+async def get_customers(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(MAX_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    _: str = Depends(get_current_email),
+):
+    return await db.customers.find({}, {"_id": 0}).sort("_id", 1).skip(skip).limit(limit).to_list(limit)
+
+@api_router.get("/customers/{customer_id}", response_model=Customer)
+async def get_customer(customer_id: str, _: str = Depends(get_current_email)):
+    customer = await db.customers.find_one({"id": customer_id}, {"_id": 0})
+    if not customer:
+        raise HTTPException(status_code=404, detail="Customer not found")
     
-    return customers
+    return customer
 
 @api_router.delete("/customers/{customer_id}")
 async def delete_customer(customer_id: str, current_user: User = Depends(get_current_user)):
@@ -336,67 +523,107 @@ async def delete_customer(customer_id: str, current_user: User = Depends(get_cur
 
 # Loan Routes
 @api_router.post("/loans", response_model=Loan)
-async def create_loan(loan_data: LoanCreate, current_user: User = Depends(get_current_user)):
-    # Generate serial number
-    serial_no = await generate_serial_number()
+async def create_loan(payload: dict = Body(...), current_user: User = Depends(get_current_user)):
+    loan_dict = parse_body(payload, LoanCreate)
+    loan_dict["serial_no"] = await generate_serial_number()
+    loan = msgspec.convert(loan_dict, LoanRecord)
     
-    # Convert ItemCreate to Item objects
-    items = [Item(**item.model_dump()) for item in loan_data.items]
-    
-    loan_dict = loan_data.model_dump()
-    loan_dict["serial_no"] = serial_no
-    loan_dict["items"] = items
-    loan_obj = Loan(**loan_dict)
-    
-    doc = loan_obj.model_dump()
-    doc["loan_date"] = doc["loan_date"].isoformat()
-    doc["created_at"] = doc["created_at"].isoformat()
+    doc = to_document(loan)
     
     await db.loans.insert_one(doc)
-    return loan_obj
+    return doc
 
-@api_router.get("/loans", response_model=List[Loan])
-async def get_loans(status: Optional[str] = None, current_user: User = Depends(get_current_user)):
+@api_router.post("/loans/bulk", response_model=List[Loan])
+async def create_loans_bulk(payload: list = Body(...), current_user: User = Depends(get_current_user)):
+    """Create many loans (e.g. an import) with one serial reservation and one insert"""
+    loan_dicts = parse_body(payload, List[LoanCreate])
+    if not loan_dicts:
+        return []
+    
+    serial_numbers = await reserve_serial_numbers(len(loan_dicts))
+    docs = []
+    for loan_dict, serial_no in zip(loan_dicts, serial_numbers):
+        loan_dict["serial_no"] = serial_no
+        docs.append(to_document(msgspec.convert(loan_dict, LoanRecord)))
+    
+    try:
+        await db.loans.insert_many(docs, ordered=False)
+    except BulkWriteError as e:
+        # Unordered inserts keep going past failures; report what did go in
+        write_errors = e.details.get("writeErrors", [])
+        failed_indexes = {error["index"] for error in write_errors}
+        all_duplicates = all(error.get("code") == 11000 for error in write_errors)
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT if all_duplicates else status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={
+                "message": f"{len(failed_indexes)} of {len(docs)} loans could not be created",
+                "inserted": [
+                    {"id": doc["id"], "serial_no": doc["serial_no"]}
+                    for index, doc in enumerate(docs) if index not in failed_indexes
+                ],
+                "failed": [
+                    {"index": error["index"], "serial_no": docs[error["index"]]["serial_no"], "error": error.get("errmsg")}
+                    for error in write_errors
+                ],
+            },
+        )
+    return docs
+
+# Fields returned by GET /loans?summary=true (no items subarray)
+LOAN_SUMMARY_PROJECTION = {
+    "_id": 0,
+    "id": 1,
+    "serial_no": 1,
+    "customer_id": 1,
+    "customer_name": 1,
+    "principal_amount": 1,
+    "status": 1,
+    "loan_date": 1,
+}
+
+@api_router.get("/loans", responses={200: {"model": List[Loan]}})
+async def get_loans(
+    status: Optional[str] = None,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(MAX_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    summary: bool = False,
+    _: str = Depends(get_current_email),
+):
     query = {}
     if status:
         query["status"] = status
     
-    loans = await db.loans.find(query, {"_id": 0}).to_list(1000)
-    
-    for loan in loans:
-        if isinstance(loan["loan_date"], str):
-            loan["loan_date"] = datetime.fromisoformat(loan["loan_date"])
-        if isinstance(loan["created_at"], str):
-            loan["created_at"] = datetime.fromisoformat(loan["created_at"])
-    
-    return loans
+    projection = LOAN_SUMMARY_PROJECTION if summary else {"_id": 0}
+    return await db.loans.find(query, projection).sort(NEWEST_FIRST).skip(skip).limit(limit).to_list(limit)
 
 @api_router.get("/loans/{loan_id}", response_model=Loan)
-async def get_loan(loan_id: str, current_user: User = Depends(get_current_user)):
+async def get_loan(loan_id: str, _: str = Depends(get_current_email)):
     loan = await db.loans.find_one({"id": loan_id}, {"_id": 0})
     if not loan:
         raise HTTPException(status_code=404, detail="Loan not found")
     
-    if isinstance(loan["loan_date"], str):
-        loan["loan_date"] = datetime.fromisoformat(loan["loan_date"])
-    if isinstance(loan["created_at"], str):
-        loan["created_at"] = datetime.fromisoformat(loan["created_at"])
-    
     return loan
 
 @api_router.get("/loans/{loan_id}/interest")
-async def calculate_loan_interest(loan_id: str, current_user: User = Depends(get_current_user)):
+async def calculate_loan_interest(loan_id: str, _: str = Depends(get_current_email)):
     loan = await db.loans.find_one({"id": loan_id}, {"_id": 0})
     if not loan:
         raise HTTPException(status_code=404, detail="Loan not found")
     
-    loan_date = datetime.fromisoformat(loan["loan_date"]) if isinstance(loan["loan_date"], str) else loan["loan_date"]
-    interest_info = calculate_interest(loan["principal_amount"], loan_date)
+    interest_info = calculate_interest(loan["principal_amount"], as_datetime(loan["loan_date"]))
     
     return interest_info
 
 @api_router.put("/loans/{loan_id}", response_model=Loan)
 async def update_loan(loan_id: str, loan_data: dict, current_user: User = Depends(get_current_user)):
+    # Clients send the loan back as JSON; keep its dates stored as BSON dates
+    try:
+        for field in ("loan_date", "created_at"):
+            if field in loan_data:
+                loan_data[field] = as_datetime(loan_data[field])
+    except ValueError:
+        raise HTTPException(status_code=422, detail=f"Invalid {field}")
+    
     # Update loan in database
     result = await db.loans.update_one(
         {"id": loan_id},
@@ -409,11 +636,6 @@ async def update_loan(loan_id: str, loan_data: dict, current_user: User = Depend
     # Fetch updated loan
     updated_loan = await db.loans.find_one({"id": loan_id}, {"_id": 0})
     
-    if isinstance(updated_loan["loan_date"], str):
-        updated_loan["loan_date"] = datetime.fromisoformat(updated_loan["loan_date"])
-    if isinstance(updated_loan["created_at"], str):
-        updated_loan["created_at"] = datetime.fromisoformat(updated_loan["created_at"])
-    
     return updated_loan
 
 @api_router.delete("/loans/{loan_id}")
@@ -427,87 +649,149 @@ async def delete_loan(loan_id: str, current_user: User = Depends(get_current_use
 
 # Payment Routes
 @api_router.post("/payments", response_model=Payment)
-async def create_payment(payment_data: PaymentCreate, current_user: User = Depends(get_current_user)):
-    # Get loan details
-    loan = await db.loans.find_one({"id": payment_data.loan_id}, {"_id": 0})
+async def create_payment(payload: dict = Body(...), current_user: User = Depends(get_current_user)):
+    payment_dict = parse_body(payload, PaymentCreate)
+    
+    # Get the loan fields copied onto the payment (skips the items subarray)
+    loan = await db.loans.find_one(
+        {"id": payment_dict["loan_id"]},
+        {"_id": 0, "serial_no": 1, "customer_name": 1}
+    )
     if not loan:
         raise HTTPException(status_code=404, detail="Loan not found")
     
-    payment_dict = payment_data.model_dump()
     payment_dict["loan_serial_no"] = loan["serial_no"]
     payment_dict["customer_name"] = loan["customer_name"]
-    payment_obj = Payment(**payment_dict)
+    payment = msgspec.convert(payment_dict, PaymentRecord)
     
-    doc = payment_obj.model_dump()
-    doc["payment_date"] = doc["payment_date"].isoformat()
-    doc["created_at"] = doc["created_at"].isoformat()
+    doc = to_document(payment)
     
     await db.payments.insert_one(doc)
-    return payment_obj
+    return doc
 
-@api_router.get("/payments", response_model=List[Payment])
-async def get_payments(current_user: User = Depends(get_current_user)):
-    payments = await db.payments.find({}, {"_id": 0}).to_list(1000)
-    
-    for payment in payments:
-        if isinstance(payment["payment_date"], str):
-            payment["payment_date"] = datetime.fromisoformat(payment["payment_date"])
-        if isinstance(payment["created_at"], str):
-            payment["created_at"] = datetime.fromisoformat(payment["created_at"])
-    
-    return payments
+@api_router.get("/payments", responses={200: {"model": List[Payment]}})
+async def get_payments(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(MAX_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    _: str = Depends(get_current_email),
+):
+    return await db.payments.find({}, {"_id": 0}).sort(NEWEST_FIRST).skip(skip).limit(limit).to_list(limit)
 
 # Admin Routes\n@api_router.delete(\"/admin/clear-all-data\")\nasync def clear_all_data(current_user: User = Depends(get_current_user)):\n    \"\"\"Clear all data from the database - DANGER ZONE\"\"\"\n    try:\n        # Clear all collections\n        await db.customers.delete_many({})\n        await db.loans.delete_many({})\n        await db.payments.delete_many({})\n        \n        return {\"message\": \"All data cleared successfully\"}\n    except Exception as e:\n        raise HTTPException(\n            status_code=500,\n            detail=f\"Failed to clear data: {str(e)}\"\n        )\n\n# Dashboard Route
-@api_router.get("/dashboard", response_model=DashboardStats)
-async def get_dashboard_stats(current_user: User = Depends(get_current_user)):
-    # Get active loans count and total amount
-    active_loans = await db.loans.find({"status": "active"}, {"_id": 0}).to_list(1000)
-    total_active_loans = len(active_loans)
-    total_loan_amount = sum(loan["principal_amount"] for loan in active_loans)
-    
-    # Get customers count
-    total_customers = await db.customers.count_documents({})
-    
-    # Calculate cash in hand (total payments received)
-    payments = await db.payments.find({}, {"_id": 0, "amount": 1}).to_list(1000)
-    cash_in_hand = sum(payment["amount"] for payment in payments)
-    
-    # Get recent loans (last 5)
-    recent_loans_docs = await db.loans.find({}, {"_id": 0}).sort("created_at", -1).limit(5).to_list(5)
-    recent_loans = []
-    for loan in recent_loans_docs:
-        if isinstance(loan["loan_date"], str):
-            loan["loan_date"] = datetime.fromisoformat(loan["loan_date"])
-        if isinstance(loan["created_at"], str):
-            loan["created_at"] = datetime.fromisoformat(loan["created_at"])
-        recent_loans.append(loan)
-    
-    # Get recent payments (last 5)
-    recent_payments_docs = await db.payments.find({}, {"_id": 0}).sort("created_at", -1).limit(5).to_list(5)
-    recent_payments = []
-    for payment in recent_payments_docs:
-        if isinstance(payment["payment_date"], str):
-            payment["payment_date"] = datetime.fromisoformat(payment["payment_date"])
-        if isinstance(payment["created_at"], str):
-            payment["created_at"] = datetime.fromisoformat(payment["created_at"])
-        recent_payments.append(payment)
-    
-    return DashboardStats(
-        total_active_loans=total_active_loans,
-        total_loan_amount=total_loan_amount,
-        total_customers=total_customers,
-        cash_in_hand=cash_in_hand,
-        recent_loans=recent_loans,
-        recent_payments=recent_payments
+@api_router.get("/dashboard", responses={200: {"model": DashboardStats}})
+async def get_dashboard_stats(_: str = Depends(get_current_email)):
+    # One round trip per collection: Mongo computes the sums, counts and recent lists
+    loans_pipeline = [
+        {"$facet": {
+            "active_stats": [
+                {"$match": {"status": "active"}},
+                {"$group": {"_id": None, "count": {"$sum": 1}, "total": {"$sum": "$principal_amount"}}},
+            ],
+            "recent": [
+                {"$sort": {"created_at": -1}},
+                {"$limit": 5},
+                {"$project": {"_id": 0}},
+            ],
+        }}
+    ]
+    payments_pipeline = [
+        {"$facet": {
+            "cash": [
+                {"$group": {"_id": None, "total": {"$sum": "$amount"}}},
+            ],
+            "recent": [
+                {"$sort": {"created_at": -1}},
+                {"$limit": 5},
+                {"$project": {"_id": 0}},
+            ],
+        }}
+    ]
+    loans_facets, payments_facets, total_customers = await asyncio.gather(
+        db.loans.aggregate(loans_pipeline).to_list(1),
+        db.payments.aggregate(payments_pipeline).to_list(1),
+        db.customers.count_documents({}),
     )
+    loans_facets = loans_facets[0]
+    payments_facets = payments_facets[0]
+    
+    active_stats = loans_facets["active_stats"][0] if loans_facets["active_stats"] else {}
+    total_active_loans = active_stats.get("count", 0)
+    total_loan_amount = active_stats.get("total", 0.0)
+    
+    # Cash in hand (total payments received)
+    cash_in_hand = payments_facets["cash"][0]["total"] if payments_facets["cash"] else 0.0
+    
+    recent_loans = loans_facets["recent"]
+    recent_payments = payments_facets["recent"]
+    
+    return {
+        "total_active_loans": total_active_loans,
+        "total_loan_amount": total_loan_amount,
+        "total_customers": total_customers,
+        "cash_in_hand": cash_in_hand,
+        "recent_loans": recent_loans,
+        "recent_payments": recent_payments,
+    }
+
+# Report Routes
+@api_router.get("/reports/interest")
+async def get_interest_report(_: str = Depends(get_current_email)):
+    """Accrued interest across all active loans, computed as one NumPy batch"""
+    loans = await db.loans.find(
+        {"status": "active"},
+        {"_id": 0, "id": 1, "serial_no": 1, "customer_name": 1, "principal_amount": 1, "loan_date": 1}
+    ).to_list(None)
+    
+    now = datetime.now(timezone.utc)
+    loan_dates = [as_datetime(loan["loan_date"]) for loan in loans]
+    principals = np.fromiter((loan["principal_amount"] for loan in loans), dtype=np.float64, count=len(loans))
+    days = np.fromiter(((now - loan_date).days for loan_date in loan_dates), dtype=np.int64, count=len(loans))
+    
+    interest = interest_batch(principals, days)
+    totals = principals + interest
+    interest_types = np.where(days <= DAYS_PER_YEAR, "simple", "compound")
+    
+    return {
+        "total_loans": len(loans),
+        "total_principal": round(float(principals.sum()), 2),
+        "total_interest": round(float(interest.sum()), 2),
+        "total_amount": round(float(totals.sum()), 2),
+        "loans": [
+            {
+                "id": loan["id"],
+                "serial_no": loan["serial_no"],
+                "customer_name": loan["customer_name"],
+                "principal": principal,
+                "interest": loan_interest,
+                "total_amount": total_amount,
+                "days": loan_days,
+                "interest_type": interest_type,
+            }
+            for loan, principal, loan_interest, total_amount, loan_days, interest_type in zip(
+                loans,
+                principals.tolist(),
+                np.round(interest, 2).tolist(),
+                np.round(totals, 2).tolist(),
+                days.tolist(),
+                interest_types.tolist(),
+            )
+        ],
+    }
 
 # Include the router in the main app
 app.include_router(api_router)
 
+# Allowed origins are parsed once; a frozenset makes the per-request origin check O(1).
+CORS_ORIGINS = frozenset(
+    origin.strip() for origin in os.environ.get('CORS_ORIGINS', '*').split(',') if origin.strip()
+)
+
+# add_middleware wraps everything registered before it, so CORS stays the
+# outermost layer only while it is the last middleware added
 app.add_middleware(
     CORSMiddleware,
     allow_credentials=True,
-    allow_origins=os.environ.get('CORS_ORIGINS', '*').split(','),
+    allow_origins=CORS_ORIGINS,
     allow_methods=["*"],
     allow_headers=["*"],
 )
@@ -519,6 +803,11 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+@app.on_event("startup")
+async def startup_db_client():
+    await create_indexes()
+    await init_loan_serial_counter()
+
 @app.on_event("shutdown")
 async def shutdown_db_client():
     client.close()
@@ -20,35 +20,61 @@ mongo_url = os.environ['MONGO_URL']
 client = AsyncIOMotorClient(mongo_url)
 db = client[os.environ['DB_NAME']]
 
-# Security
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Security: minimum bcrypt rounds, this only seeds the demo account
+# (the backend rehashes it with its current scheme on first login)
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=4)
+
+async def insert_missing(collection, docs):
+    """Insert the docs whose id is not in the collection yet; returns the ids that already existed"""
+    ids = [doc["id"] for doc in docs]
+    existing_ids = {doc["id"] async for doc in collection.find({"id": {"$in": ids}}, {"id": 1, "_id": 0})}
+    missing = [doc for doc in docs if doc["id"] not in existing_ids]
+    if missing:
+        await collection.insert_many(missing, ordered=False)
+    return existing_ids
 
 async def setup_demo_data():
     print("🚀 Setting up demo data for Gold Silver Loan Management System...")
     
+    # One timestamp for every seeded document; dates are stored as BSON dates,
+    # matching what the backend writes
+    now = datetime.now(timezone.utc)
+    
+    # Indexes backing the existence checks below (no-op when already present)
+    await asyncio.gather(
+        db.users.create_index("email", unique=True),
+        db.customers.create_index("id", unique=True),
+        db.loans.create_index("id", unique=True),
+        db.loans.create_index("serial_no"),
+        db.payments.create_index("id", unique=True),
+        db.payments.create_index("loan_id"),
+    )
+    
     # Create demo admin user
     print("👤 Creating demo admin user...")
-    hashed_password = pwd_context.hash("password123")
-    
-    user_doc = {
-        "id": "admin-user-001",
-        "email": "admin@vault.com",
-        "name": "Admin User",
-        "is_active": True,
-        "created_at": datetime.now(timezone.utc).isoformat(),
-        "password": hashed_password
-    }
     
-    # Check if user already exists
-    existing_user = await db.users.find_one({"email": "admin@vault.com"})
+    # Check if user already exists before paying for the password hash
+    existing_user = await db.users.find_one({"email": "admin@vault.com"}, {"_id": 1})
     if existing_user:
         print("✅ Admin user already exists")
     else:
-        await db.users.insert_one(user_doc)
+        user_doc = {
+            "id": "admin-user-001",
+            "email": "admin@vault.com",
+            "name": "Admin User",
+            "is_active": True,
+            "created_at": now,
+            "password": pwd_context.hash("password123")
+        }
+        # Upsert so a concurrent run cannot create a second admin
+        await db.users.update_one(
+            {"email": "admin@vault.com"},
+            {"$setOnInsert": user_doc},
+            upsert=True
+        )
         print("✅ Admin user created - email: admin@vault.com, password: password123")
     
-    # Create demo customers
-    print("👥 Creating demo customers...")
+    # Demo customers
     customers = [
         {
             "id": "customer-001",
@@ -56,7 +82,7 @@ async def setup_demo_data():
             "phone": "+91-9876543210",
             "address": "123, MG Road, Bangalore, Karnataka - 560001",
             "id_proof": "AADHAR-123456789012",
-            "created_at": datetime.now(timezone.utc).isoformat()
+            "created_at": now
         },
         {
             "id": "customer-002",
@@ -64,7 +90,7 @@ async def setup_demo_data():
             "phone": "+91-9876543211",
             "address": "456, Brigade Road, Bangalore, Karnataka - 560025",
             "id_proof": "PAN-ABCDE1234F",
-            "created_at": datetime.now(timezone.utc).isoformat()
+            "created_at": now
         },
         {
             "id": "customer-003",
@@ -72,20 +98,11 @@ async def setup_demo_data():
             "phone": "+91-9876543212",
             "address": "789, Commercial Street, Bangalore, Karnataka - 560001",
             "id_proof": "DL-KA0320230123456",
-            "created_at": datetime.now(timezone.utc).isoformat()
+            "created_at": now
         }
     ]
     
-    for customer in customers:
-        existing = await db.customers.find_one({"id": customer["id"]})
-        if not existing:
-            await db.customers.insert_one(customer)
-            print(f"✅ Created customer: {customer['name']}")
-        else:
-            print(f"✅ Customer already exists: {customer['name']}")
-    
-    # Create demo loans
-    print("💰 Creating demo loans...")
+    # Demo loans
     loans = [
         {
             "id": "loan-001",
@@ -93,7 +110,7 @@ async def setup_demo_data():
             "customer_id": "customer-001",
             "customer_name": "Rajesh Kumar",
             "principal_amount": 50000.0,
-            "loan_date": "2024-01-15T10:00:00.000Z",
+            "loan_date": datetime(2024, 1, 15, 10, 0, tzinfo=timezone.utc),
             "status": "active",
             "items": [
                 {
@@ -107,7 +124,7 @@ async def setup_demo_data():
                     "value": 55000.0
                 }
             ],
-            "created_at": datetime.now(timezone.utc).isoformat()
+            "created_at": now
         },
         {
             "id": "loan-002",
@@ -115,7 +132,7 @@ async def setup_demo_data():
             "customer_id": "customer-002",
             "customer_name": "Priya Sharma",
             "principal_amount": 25000.0,
-            "loan_date": "2024-02-01T14:30:00.000Z",
+            "loan_date": datetime(2024, 2, 1, 14, 30, tzinfo=timezone.utc),
             "status": "active",
             "items": [
                 {
@@ -129,7 +146,7 @@ async def setup_demo_data():
                     "value": 30000.0
                 }
             ],
-            "created_at": datetime.now(timezone.utc).isoformat()
+            "created_at": now
         },
         {
             "id": "loan-003",
@@ -137,7 +154,7 @@ async def setup_demo_data():
             "customer_id": "customer-003",
             "customer_name": "Anil Patel",
             "principal_amount": 75000.0,
-            "loan_date": "2024-03-10T11:15:00.000Z",
+            "loan_date": datetime(2024, 3, 10, 11, 15, tzinfo=timezone.utc),
             "status": "active",
             "items": [
                 {
@@ -161,20 +178,11 @@ async def setup_demo_data():
                     "value": 65000.0
                 }
             ],
-            "created_at": datetime.now(timezone.utc).isoformat()
+            "created_at": now
         }
     ]
     
-    for loan in loans:
-        existing = await db.loans.find_one({"id": loan["id"]})
-        if not existing:
-            await db.loans.insert_one(loan)
-            print(f"✅ Created loan: {loan['serial_no']} for {loan['customer_name']}")
-        else:
-            print(f"✅ Loan already exists: {loan['serial_no']}")
-    
-    # Create demo payments
-    print("💳 Creating demo payments...")
+    # Demo payments
     payments = [
         {
             "id": "payment-001",
@@ -182,10 +190,10 @@ async def setup_demo_data():
             "loan_serial_no": "A150",
             "customer_name": "Rajesh Kumar",
             "amount": 5000.0,
-            "payment_date": "2024-02-15T10:00:00.000Z",
+            "payment_date": datetime(2024, 2, 15, 10, 0, tzinfo=timezone.utc),
             "payment_type": "cash",
             "notes": "Partial payment",
-            "created_at": datetime.now(timezone.utc).isoformat()
+            "created_at": now
         },
         {
             "id": "payment-002",
@@ -193,17 +201,42 @@ async def setup_demo_data():
             "loan_serial_no": "A151",
             "customer_name": "Priya Sharma",
             "amount": 2500.0,
-            "payment_date": "2024-03-01T15:30:00.000Z",
+            "payment_date": datetime(2024, 3, 1, 15, 30, tzinfo=timezone.utc),
             "payment_type": "cash",
             "notes": "Monthly payment",
-            "created_at": datetime.now(timezone.utc).isoformat()
+            "created_at": now
         }
     ]
     
+    # The collections do not depend on each other, so seed them concurrently
+    print("📦 Creating demo customers, loans and payments...")
+    existing_customer_ids, existing_loan_ids, existing_payment_ids = await asyncio.gather(
+        insert_missing(db.customers, customers),
+        insert_missing(db.loans, loans),
+        insert_missing(db.payments, payments),
+    )
+    
+    # Keep the backend's loan serial counter ahead of the seeded serials
+    await db.counters.update_one(
+        {"_id": "loan_serial"},
+        {"$max": {"seq": max(int(loan["serial_no"][1:]) for loan in loans)}},
+        upsert=True
+    )
+    
+    for customer in customers:
+        if customer["id"] not in existing_customer_ids:
+            print(f"✅ Created customer: {customer['name']}")
+        else:
+            print(f"✅ Customer already exists: {customer['name']}")
+    
+    for loan in loans:
+        if loan["id"] not in existing_loan_ids:
+            print(f"✅ Created loan: {loan['serial_no']} for {loan['customer_name']}")
+        else:
+            print(f"✅ Loan already exists: {loan['serial_no']}")
+    
     for payment in payments:
-        existing = await db.payments.find_one({"id": payment["id"]})
-        if not existing:
-            await db.payments.insert_one(payment)
+        if payment["id"] not in existing_payment_ids:
             print(f"✅ Created payment: ₹{payment['amount']} for {payment['customer_name']}")
         else:
             print(f"✅ Payment already exists for {payment['customer_name']}")